@@ -27,6 +27,13 @@ describe('schema', () => {
       .get();
     expect(fts).toBeDefined();
   });
+  it('reuses prepared statements across calls', () => {
+    backend.getNodeByName('A');
+    const size = (backend as any).statements.size;
+    expect(size).toBeGreaterThan(0);
+    backend.getNodeByName('B');
+    expect((backend as any).statements.size).toBe(size);
+  });
 });
 // ---- node CRUD ----
 describe('createNodes', () => {
@@ -280,6 +287,15 @@ describe('exploreContext', () => {
     // C has edge weight 0.7 < 0.75 so should not be reached
     expect(names).not.toContain('C');
   });
+  it('filters by includeTypes', () => {
+    const graph = backend.exploreContext(['A'], {
+      maxDepth: 3,
+      includeTypes: ['Entity'],
+    });
+    const names = graph.entities.map((e) => e.name).sort();
+    expect(names).toEqual(['A', 'C', 'D']);
+    expect(graph.relations.some((r) => r.to === 'B')).toBe(false);
+  });
 });
 describe('getTemporalSequence', () => {
   beforeEach(() => {
@@ -307,6 +323,14 @@ describe('getTemporalSequence', () => {
     expect(names).toContain('E2');
     expect(names).toContain('E1');
   });
+  it('returns an empty sequence for an unknown direction', () => {
+    for (const direction of ['toString', 'constructor', '__proto__']) {
+      const graph = backend.getTemporalSequence('E1', {
+        direction: direction as any,
+      });
+      expect(graph).toEqual({ entities: [], relations: [] });
+    }
+  });
 });
 describe('findShortestPath', () => {
   it('finds a path between two nodes', () => {
@@ -50,17 +50,85 @@ const TEMPORAL_RELATION_TYPES = new Set([
   'causedBy',
 ]);
 
+/** `?` placeholders and bind values for the temporal relation-type filter. */
+const TEMPORAL_TYPE_PLACEHOLDERS = [...TEMPORAL_RELATION_TYPES]
+  .map(() => '?')
+  .join(',');
+const TEMPORAL_TYPE_PARAMS = [...TEMPORAL_RELATION_TYPES];
+
+/** Recursive CTE that walks temporal edges from `?`, joining on `via` and stepping to `next`. */
+function temporalSequenceSql(
+  next: 'to_node' | 'from_node',
+  via: 'from_node' | 'to_node'
+): string {
+  return `WITH RECURSIVE seq(name, depth) AS (
+     SELECT ?, 0
+     UNION
+     SELECT e.${next}, s.depth + 1
+     FROM seq s
+     JOIN edges e ON e.${via} = s.name
+     WHERE e.relation_type IN (${TEMPORAL_TYPE_PLACEHOLDERS})
+       AND s.depth < ?
+   )
+   SELECT DISTINCT n.* FROM seq s JOIN nodes n ON n.name = s.name`;
+}
+
+const TEMPORAL_FORWARD_SQL = temporalSequenceSql('to_node', 'from_node');
+const TEMPORAL_BACKWARD_SQL = temporalSequenceSql('from_node', 'to_node');
+
+/** Traversals to run, in merge order, for each temporal direction. */
+const TEMPORAL_SEQUENCE_SQL = new Map<string, string[]>([
+  ['forward', [TEMPORAL_FORWARD_SQL]],
+  ['backward', [TEMPORAL_BACKWARD_SQL]],
+  ['both', [TEMPORAL_FORWARD_SQL, TEMPORAL_BACKWARD_SQL]],
+]);
+
+/** Relation fields stored in dedicated `edges` columns (everything else goes into `properties`). */
+const RELATION_FIELDS = new Set([
+  'from',
+  'to',
+  'relationType',
+  'context',
+  'confidenceScore',
+  'weight',
+]);
+
+/** Entity fields kept out of `properties` (DB columns plus structural fields). */
+const ENTITY_RESERVED_FIELDS = new Set([
+  ...NODE_COLUMNS,
+  'entityType',
+  'observations',
+]);
+
+/** Serialize every non-null field of `obj` not in `reserved` as the `properties` JSON blob. */
+function extractProperties(obj: object, reserved: Set<string>): string {
+  const props: Record<string, unknown> = {};
+  for (const [k, v] of Object.entries(obj)) {
+    if (reserved.has(k)) continue;
+    if (v !== undefined && v !== null) props[k] = v;
+  }
+  return JSON.stringify(props);
+}
+
+/** Entity text fields indexed into search_text (after `name`), in order. */
+const SEARCH_TEXT_FIELDS = [
+  'description',
+  'statement',
+  'content',
+  'thoughtContent',
+  'definition',
+  'hypothesis',
+  'conclusion',
+] as const;
+
 /** Build the search_text column from various fields. */
 function buildSearchText(entity: Entity): string {
-  const parts: string[] = [entity.name];
-  if (entity.description) parts.push(entity.description);
-  if (entity.statement) parts.push(entity.statement);
-  if (entity.content) parts.push(entity.content);
-  if (entity.thoughtContent) parts.push(entity.thoughtContent);
-  if (entity.definition) parts.push(entity.definition);
-  if (entity.hypothesis) parts.push(entity.hypothesis);
-  if (entity.conclusion) parts.push(entity.conclusion);
-  return parts.join(' ');
+  let text = entity.name;
+  for (const field of SEARCH_TEXT_FIELDS) {
+    const value = entity[field];
+    if (value) text += ' ' + value;
+  }
+  return text;
 }
 
 /** Split an Entity into DB columns + a properties JSON blob. */
@@ -75,22 +143,6 @@ function entityToRow(entity: Entity) {
     confidence !== null && confidence < 0.5 ? 'candidate' : 'active';
   const searchText = buildSearchText(entity);
 
-  // Everything that is not a top-level DB column goes into `properties`
-  const props: Record<string, unknown> = {};
-  for (const [k, v] of Object.entries(entity)) {
-    if (
-      k === 'name' ||
-      k === 'entityType' ||
-      k === 'observations' ||
-      NODE_COLUMNS.has(k)
-    ) {
-      continue;
-    }
-    if (v !== undefined && v !== null) {
-      props[k] = v;
-    }
-  }
-
   return {
     name: entity.name,
     nodeType,
@@ -100,7 +152,8 @@ function entityToRow(entity: Entity) {
     statement,
     content,
     confidence,
-    properties: JSON.stringify(props),
+    // Everything that is not a top-level DB column goes into `properties`
+    properties: extractProperties(entity, ENTITY_RESERVED_FIELDS),
     searchText,
   };
 }
@@ -151,6 +204,7 @@ function rowToRelation(row: Record<string, unknown>): Relation {
 export class SqliteBackend implements StorageBackend {
   private db!: Database.Database;
   private dbPath: string;
+  private statements = new Map<string, Database.Statement>();
 
   constructor(dbPath?: string) {
     this.dbPath =
@@ -179,13 +233,14 @@ export class SqliteBackend implements StorageBackend {
   }
 
   close(): void {
+    this.statements.clear();
     this.db?.close();
   }
 
   // ---------- write ----------
 
   createNodes(nodes: Entity[]): Entity[] {
-    const upsert = this.db.prepare(`
+    const upsert = this.prepare(`
       INSERT INTO nodes (name, node_type, sub_type, status, description, statement, content, confidence, properties, search_text)
       VALUES (@name, @nodeType, @subType, @status, @description, @statement, @content, @confidence, @properties, @searchText)
       ON CONFLICT(name) DO UPDATE SET
@@ -201,11 +256,11 @@ export class SqliteBackend implements StorageBackend {
         updated_at  = strftime('%Y-%m-%dT%H:%M:%fZ','now')
     `);
 
-    const insertObs = this.db.prepare(
+    const insertObs = this.prepare(
       'INSERT INTO observations (node_name, content) VALUES (?, ?)'
     );
 
-    const insertAlias = this.db.prepare(
+    const insertAlias = this.prepare(
       'INSERT OR IGNORE INTO aliases (alias, canonical_name) VALUES (?, ?)'
     );
 
@@ -235,7 +290,7 @@ export class SqliteBackend implements StorageBackend {
   }
 
   createRelations(relations: Relation[]): Relation[] {
-    const upsert = this.db.prepare(`
+    const upsert = this.prepare(`
       INSERT INTO edges (from_node, to_node, relation_type, confidence, weight, context, properties)
       VALUES (@from, @to, @relationType, @confidence, @weight, @context, @properties)
       ON CONFLICT(from_node, to_node, relation_type) DO UPDATE SET
@@ -247,22 +302,6 @@ export class SqliteBackend implements StorageBackend {
 
     const tx = this.db.transaction((rels: Relation[]) => {
       for (const rel of rels) {
-        const props: Record<string, unknown> = {};
-        for (const [k, v] of Object.entries(rel)) {
-          if (
-            [
-              'from',
-              'to',
-              'relationType',
-              'context',
-              'confidenceScore',
-              'weight',
-            ].includes(k)
-          )
-            continue;
-          if (v !== undefined && v !== null) props[k] = v;
-        }
-
         upsert.run({
           from: rel.from,
           to: rel.to,
@@ -270,7 +309,7 @@ export class SqliteBackend implements StorageBackend {
           confidence: rel.confidenceScore ?? null,
           weight: rel.weight ?? 0.5,
           context: rel.context ?? null,
-          properties: JSON.stringify(props),
+          properties: extractProperties(rel, RELATION_FIELDS),
         });
       }
     });
@@ -280,7 +319,7 @@ export class SqliteBackend implements StorageBackend {
   }
 
   deleteNodes(names: string[]): void {
-    const del = this.db.prepare('DELETE FROM nodes WHERE name = ?');
+    const del = this.prepare('DELETE FROM nodes WHERE name = ?');
     const tx = this.db.transaction((ns: string[]) => {
       for (const n of ns) del.run(n);
     });
@@ -290,7 +329,7 @@ export class SqliteBackend implements StorageBackend {
   deleteRelations(
     relations: { from: string; to: string; relationType: string }[]
   ): void {
-    const del = this.db.prepare(
+    const del = this.prepare(
       'DELETE FROM edges WHERE from_node = ? AND to_node = ? AND relation_type = ?'
     );
     const tx = this.db.transaction(
@@ -304,7 +343,7 @@ export class SqliteBackend implements StorageBackend {
   addObservations(
     observations: { nodeName: string; contents: string[] }[]
   ): void {
-    const ins = this.db.prepare(
+    const ins = this.prepare(
       'INSERT INTO observations (node_name, content) VALUES (?, ?)'
     );
     const tx = this.db.transaction(
@@ -347,16 +386,14 @@ export class SqliteBackend implements StorageBackend {
           unknown
         >[];
       } else {
-        rows = this.db
-          .prepare(
-            `SELECT n.*, bm25(nodes_fts) AS rank
+        rows = this.prepare(
+          `SELECT n.*, bm25(nodes_fts) AS rank
              FROM nodes_fts fts
              JOIN nodes n ON n.rowid = fts.rowid
              WHERE nodes_fts MATCH ?
              ORDER BY rank
              LIMIT ?`
-          )
-          .all(ftsQuery, limit) as Record<string, unknown>[];
+        ).all(ftsQuery, limit) as Record<string, unknown>[];
       }
     } else {
       rows = [];
@@ -372,9 +409,9 @@ export class SqliteBackend implements StorageBackend {
   }
 
   getNodeByName(name: string): Entity | null {
-    const row = this.db
-      .prepare('SELECT * FROM nodes WHERE name = ?')
-      .get(name) as Record<string, unknown> | undefined;
+    const row = this.prepare('SELECT * FROM nodes WHERE name = ?').get(
+      name
+    ) as Record<string, unknown> | undefined;
 
     if (!row) {
       // try alias resolution
@@ -403,11 +440,9 @@ export class SqliteBackend implements StorageBackend {
   }
 
   resolveAlias(alias: string): string | null {
-    const row = this.db
-      .prepare(
-        'SELECT canonical_name FROM aliases WHERE alias = ? ORDER BY match_score DESC LIMIT 1'
-      )
-      .get(alias.toLowerCase()) as { canonical_name: string } | undefined;
+    const row = this.prepare(
+      'SELECT canonical_name FROM aliases WHERE alias = ? ORDER BY match_score DESC LIMIT 1'
+    ).get(alias.toLowerCase()) as { canonical_name: string } | undefined;
 
     return row?.canonical_name ?? null;
   }
@@ -442,14 +477,15 @@ export class SqliteBackend implements StorageBackend {
       )
       .all(...nodeNames, maxDepth, minWeight) as Record<string, unknown>[];
 
-    let entities = rows.map(rowToEntity);
+    // Filter on the raw rows so dropped nodes are never decoded or given observations
+    const types = options?.includeTypes?.length
+      ? new Set(options.includeTypes)
+      : null;
+    const entities = (
+      types ? rows.filter((r) => types.has(r.node_type as string)) : rows
+    ).map(rowToEntity);
     this.attachObservations(entities);
 
-    if (options?.includeTypes?.length) {
-      const types = new Set(options.includeTypes);
-      entities = entities.filter((e) => types.has(e.entityType));
-    }
-
     const relations = this.getEdgesBetween(entities.map((e) => e.name));
 
     return { entities, relations };
@@ -461,61 +497,20 @@ export class SqliteBackend implements StorageBackend {
   ): KnowledgeGraph {
     const direction = options?.direction ?? 'both';
     const maxEvents = options?.maxEvents ?? 10;
-    const temporalTypes = [...TEMPORAL_RELATION_TYPES]
-      .map(() => '?')
-      .join(',');
-    const temporalParams = [...TEMPORAL_RELATION_TYPES];
-
-    let rows: Record<string, unknown>[];
 
-    if (direction === 'forward' || direction === 'both') {
-      const fwd = this.db
-        .prepare(
-          `WITH RECURSIVE seq(name, depth) AS (
-             SELECT ?, 0
-             UNION
-             SELECT e.to_node, s.depth + 1
-             FROM seq s
-             JOIN edges e ON e.from_node = s.name
-             WHERE e.relation_type IN (${temporalTypes})
-               AND s.depth < ?
-           )
-           SELECT DISTINCT n.* FROM seq s JOIN nodes n ON n.name = s.name`
-        )
-        .all(startNode, ...temporalParams, maxEvents) as Record<
-        string,
-        unknown
-      >[];
-      rows = fwd;
-    } else {
-      rows = [];
-    }
-
-    if (direction === 'backward' || direction === 'both') {
-      const bwd = this.db
-        .prepare(
-          `WITH RECURSIVE seq(name, depth) AS (
-             SELECT ?, 0
-             UNION
-             SELECT e.from_node, s.depth + 1
-             FROM seq s
-             JOIN edges e ON e.to_node = s.name
-             WHERE e.relation_type IN (${temporalTypes})
-               AND s.depth < ?
-           )
-           SELECT DISTINCT n.* FROM seq s JOIN nodes n ON n.name = s.name`
-        )
-        .all(startNode, ...temporalParams, maxEvents) as Record<
-        string,
-        unknown
-      >[];
-
-      // Merge, avoiding duplicates
-      const seen = new Set(rows.map((r) => r.name));
-      for (const r of bwd) {
+    // Merge traversals in order, avoiding duplicates
+    const rows: Record<string, unknown>[] = [];
+    const seen = new Set<unknown>();
+    for (const sql of TEMPORAL_SEQUENCE_SQL.get(direction) ?? []) {
+      const found = this.prepare(sql).all(
+        startNode,
+        ...TEMPORAL_TYPE_PARAMS,
+        maxEvents
+      ) as Record<string, unknown>[];
+      for (const r of found) {
         if (!seen.has(r.name)) {
+          seen.add(r.name);
           rows.push(r);
-          seen.add(r.name as string);
         }
       }
     }
@@ -533,9 +528,8 @@ export class SqliteBackend implements StorageBackend {
     maxDepth = 6
   ): KnowledgeGraph {
     // BFS via recursive CTE with path tracking
-    const rows = this.db
-      .prepare(
-        `WITH RECURSIVE bfs(name, depth, path) AS (
+    const rows = this.prepare(
+      `WITH RECURSIVE bfs(name, depth, path) AS (
            SELECT ?, 0, ?
            UNION
            SELECT
@@ -548,8 +542,7 @@ export class SqliteBackend implements StorageBackend {
              AND instr(b.path, CASE WHEN e.from_node = b.name THEN e.to_node ELSE e.from_node END) = 0
          )
          SELECT path FROM bfs WHERE name = ? ORDER BY depth LIMIT 1`
-      )
-      .get(from, from, maxDepth, to) as { path: string } | undefined;
+    ).get(from, from, maxDepth, to) as { path: string } | undefined;
 
     if (!rows) return { entities: [], relations: [] };
 
@@ -648,14 +641,12 @@ export class SqliteBackend implements StorageBackend {
     if (!chain) return { entities: [], relations: [] };
 
     // Get steps via HAS_STEP edges
-    const stepRows = this.db
-      .prepare(
-        `SELECT n.* FROM edges e
+    const stepRows = this.prepare(
+      `SELECT n.* FROM edges e
          JOIN nodes n ON n.name = e.to_node
          WHERE e.from_node = ? AND e.relation_type = 'HAS_STEP'
          ORDER BY json_extract(n.properties, '$.stepNumber')`
-      )
-      .all(chainName) as Record<string, unknown>[];
+    ).all(chainName) as Record<string, unknown>[];
 
     const steps = stepRows.map(rowToEntity);
     this.attachObservations(steps);
@@ -673,43 +664,31 @@ export class SqliteBackend implements StorageBackend {
     const ftsQuery = buildFtsQuery(topics.join(' '));
     if (!ftsQuery) return { entities: [], relations: [] };
 
-    const chainRows = this.db
-      .prepare(
-        `SELECT n.* FROM nodes_fts fts
+    const chainRows = this.prepare(
+      `SELECT n.* FROM nodes_fts fts
          JOIN nodes n ON n.rowid = fts.rowid
          WHERE nodes_fts MATCH ?
            AND n.node_type = 'ReasoningChain'
          ORDER BY bm25(nodes_fts)
          LIMIT ?`
-      )
-      .all(ftsQuery, limit) as Record<string, unknown>[];
+    ).all(ftsQuery, limit) as Record<string, unknown>[];
 
-    const allEntities: Entity[] = [];
-    const allRelations: Relation[] = [];
+    // Deduplicate while collecting
+    const seenEntities = new Map<string, Entity>();
+    const seenRelations = new Map<string, Relation>();
 
     for (const row of chainRows) {
       const graph = this.getReasoningChain(row.name as string);
-      allEntities.push(...graph.entities);
-      allRelations.push(...graph.relations);
-    }
-
-    // Deduplicate
-    const seenEntities = new Map<string, Entity>();
-    for (const e of allEntities) seenEntities.set(e.name, e);
-
-    const seenRelations = new Set<string>();
-    const uniqueRelations: Relation[] = [];
-    for (const r of allRelations) {
-      const key = `${r.from}|${r.to}|${r.relationType}`;
-      if (!seenRelations.has(key)) {
-        seenRelations.add(key);
-        uniqueRelations.push(r);
+      for (const e of graph.entities) seenEntities.set(e.name, e);
+      for (const r of graph.relations) {
+        const key = `${r.from}|${r.to}|${r.relationType}`;
+        if (!seenRelations.has(key)) seenRelations.set(key, r);
       }
     }
 
     return {
       entities: [...seenEntities.values()],
-      relations: uniqueRelations,
+      relations: [...seenRelations.values()],
     };
   }
 
@@ -721,6 +700,20 @@ export class SqliteBackend implements StorageBackend {
 
   // ---------- private helpers ----------
 
+  /**
+   * Prepare a statement once per connection and reuse it on later calls.
+   * Only use for fixed SQL — queries with a variable-length `IN (...)` list
+   * would grow the cache without bound.
+   */
+  private prepare(sql: string): Database.Statement {
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
   private attachObservations(entities: Entity[]): void {
     if (entities.length === 0) return;
     const names = entities.map((e) => e.name);
@@ -733,8 +726,9 @@ export class SqliteBackend implements StorageBackend {
 
     const obsMap = new Map<string, string[]>();
     for (const o of obsRows) {
-      if (!obsMap.has(o.node_name)) obsMap.set(o.node_name, []);
-      obsMap.get(o.node_name)!.push(o.content);
+      const list = obsMap.get(o.node_name);
+      if (list) list.push(o.content);
+      else obsMap.set(o.node_name, [o.content]);
     }
 
     for (const e of entities) {
@@ -744,13 +738,12 @@ export class SqliteBackend implements StorageBackend {
 
   private getEdgesBetween(names: string[]): Relation[] {
     if (names.length === 0) return [];
-    const placeholders = names.map(() => '?').join(',');
-    const rows = this.db
-      .prepare(
-        `SELECT * FROM edges
-         WHERE from_node IN (${placeholders}) AND to_node IN (${placeholders})`
-      )
-      .all(...names, ...names) as Record<string, unknown>[];
+    // Bind the name list once as JSON; both endpoints probe the same materialized set
+    const rows = this.prepare(
+      `WITH names(name) AS (SELECT value FROM json_each(?))
+       SELECT * FROM edges
+       WHERE from_node IN names AND to_node IN names`
+    ).all(JSON.stringify(names)) as Record<string, unknown>[];
 
     return rows.map(rowToRelation);
   }